@@ -1,3 +1,10 @@
+def pytest_addoption(parser):
+    parser.addoption(
+        '--load-requests', action='store', type=int, default=0,
+        help='Number of synthetic requests to replay in the load test (disabled by default)'
+    )
+
+
 def pytest_configure():
     from django.conf import settings
 
@@ -33,6 +40,7 @@ def pytest_configure():
             'date_versionning',
             'rest_framework',
             'rest_framework.authtoken',
+            'tests',
         ),
         PASSWORD_HASHERS=(
             'django.contrib.auth.hashers.SHA1PasswordHasher',
@@ -1,5 +1,6 @@
 import copy
 
+from collections import OrderedDict
 from datetime import datetime
 from rest_framework.versioning import BaseVersioning
 from rest_framework import exceptions, serializers
@@ -107,10 +108,12 @@ class VersionnedSerializer(serializers.Serializer):
         meta = getattr(self, 'Meta', {})
         versions = getattr(meta, 'versions', {})
 
-        return {
-            name: v for name, v in versions.items()
+        # Changes are applied by date, most recent first, whatever the order
+        # they were declared in
+        return OrderedDict(
+            (name, versions[name]) for name in sorted(versions, reverse=True)
             if name >= self.version
-        }
+        )
 
     @property
     def version(self):
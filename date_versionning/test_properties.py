@@ -0,0 +1,200 @@
+import copy
+import math
+import random
+import string
+import timeit
+
+import pytest
+
+from collections import OrderedDict
+from datetime import date, timedelta
+from rest_framework import serializers
+from rest_framework.decorators import APIView
+from rest_framework.response import Response
+from tests.models import Homeworld, Person
+from tests.serializers import PersonSerializer
+from . import DateHeaderVersioning, RemoveField, RenameField, AddField, VersionnedSerializer
+
+
+EXAMPLES = 200
+MAX_CHANGES = 8
+
+
+def random_value(rng):
+    return ''.join(rng.choice(string.ascii_letters) for _ in range(rng.randint(1, 10)))
+
+
+def random_chain(seed):
+    """Generates a random payload at the latest version and a random chain of
+    changes that can be applied to it.
+
+    The chain is built by walking back in time from the latest payload so that
+    every change is valid for the payload it will be applied to. The versions
+    are returned in a random order since `Meta.versions` is often a plain dict
+    and changes must be applied by date, not by declaration order.
+    """
+    rng = random.Random(seed)
+    names = ('field{}'.format(i) for i in range(1000))
+
+    payload = {next(names): random_value(rng) for _ in range(rng.randint(1, 6))}
+    current = copy.deepcopy(payload)
+
+    versions = []
+    day = date(2018, 8, 31)
+    for _ in range(rng.randint(1, MAX_CHANGES)):
+        operation = rng.choice(['remove', 'rename', 'add'])
+        if operation == 'add' and len(current) < 2:
+            operation = 'remove'
+
+        if operation == 'remove':
+            change = RemoveField(next(names), serializers.CharField(), default=random_value(rng))
+        elif operation == 'rename':
+            change = RenameField(next(names), rng.choice(sorted(current)))
+        else:
+            # The field must hold its default value for update() to restore it
+            name = rng.choice(sorted(current))
+            change = AddField(name, serializers.CharField(), default=current[name])
+
+        current = change.downgrade(payload=current)[1]
+        versions.append((day.strftime(r'%Y-%m-%d'), change))
+        day -= timedelta(days=rng.randint(1, 30))
+
+    rng.shuffle(versions)
+    return payload, OrderedDict(versions)
+
+
+def requested_versions(versions):
+    """All the versions worth requesting for a chain: each change date, a date
+    before every change and a date after every change."""
+    return sorted(versions) + ['2000-01-01', '2100-01-01']
+
+
+def reference_downgrade(versions, version, payload):
+    """Naive reference engine, applies each change from the newest to the oldest"""
+    data = copy.deepcopy(payload)
+    for name in sorted(versions, reverse=True):
+        if name >= version:
+            data = versions[name].downgrade(payload=data)[1]
+    return data
+
+
+def reference_update(versions, version, payload):
+    """Naive reference engine, applies each change from the oldest to the newest"""
+    data = copy.deepcopy(payload)
+    for name in sorted(versions):
+        if name >= version:
+            data = versions[name].update(payload=data)
+    return data
+
+
+def reference_fields(versions, version, payload):
+    fields = OrderedDict((name, serializers.CharField()) for name in payload)
+    for name in sorted(versions, reverse=True):
+        if name >= version:
+            fields = versions[name].downgrade(fields=fields)[0]
+    return list(fields)
+
+
+def build_serializer(payload, versions):
+    attrs = OrderedDict((name, serializers.CharField()) for name in payload)
+    attrs['Meta'] = type('Meta', (object,), {'versions': versions})
+    return type('GeneratedSerializer', (VersionnedSerializer,), attrs)
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[int(math.ceil(p / 100.0 * len(values))) - 1]
+
+
+class TestChainProperties:
+    @pytest.mark.parametrize('seed', range(EXAMPLES))
+    def test_round_trip(self, seed):
+        payload, versions = random_chain(seed)
+
+        for version in requested_versions(versions):
+            downgraded = reference_downgrade(versions, version, payload)
+            assert reference_update(versions, version, downgraded) == payload, (seed, version)
+
+    @pytest.mark.parametrize('seed', range(EXAMPLES))
+    def test_serializer_matches_reference(self, seed, rf):
+        payload, versions = random_chain(seed)
+        serializer_class = build_serializer(payload, versions)
+
+        for version in requested_versions(versions):
+            request = rf.get('/')
+            request.version = version
+            context = {'request': request}
+            expected = reference_downgrade(versions, version, payload)
+
+            serializer = serializer_class(context=context)
+            assert list(serializer.fields) == reference_fields(versions, version, payload), (seed, version)
+
+            serializer = serializer_class(instance=payload, context=context)
+            assert serializer.data == expected, (seed, version)
+
+            serializer = serializer_class(data=expected, context=context)
+            serializer.is_valid(raise_exception=True)
+            assert dict(serializer.updated_data) == payload, (seed, version)
+
+
+class PersonView(APIView):
+    versioning_class = DateHeaderVersioning
+
+    def get(self, request, *args, **kwargs):
+        person = Person.objects.select_related('homeworld').get(pk=kwargs['pk'])
+        serializer = PersonSerializer(instance=person, context={'request': request})
+        return Response(serializer.data)
+
+
+class TestLoad:
+    @pytest.mark.django_db
+    def test_multi_version_requests(self, request, rf, capsys):
+        count = request.config.getoption('--load-requests')
+        if not count:
+            pytest.skip('use --load-requests=N to replay N synthetic requests')
+
+        kashyyyk = Homeworld.objects.create(name='Kashyyyk')
+        chewby = Person.objects.create(
+            name="Chewbacca",
+            birthYear="200BBY",
+            eyeColor="blue",
+            gender="male",
+            hairColor="brown",
+            height=228,
+            mass=112,
+            homeworld=kashyyyk
+        )
+        latest = PersonSerializer(instance=chewby).data
+        versions = PersonSerializer.Meta.versions
+
+        # None means no X-Version header, i.e. the latest version
+        mix = requested_versions(versions) + [None]
+        rng = random.Random(0)
+        view = PersonView.as_view()
+
+        latencies = []
+        replay_start = timeit.default_timer()
+        for _ in range(count):
+            version = rng.choice(mix)
+            headers = {'X-Version': version} if version is not None else {}
+            http_request = rf.get('/', **headers)
+
+            start = timeit.default_timer()
+            response = view(http_request, pk=chewby.pk)
+            response.render()
+            latencies.append(timeit.default_timer() - start)
+
+            assert response.status_code == 200
+            if version is not None:
+                assert response.data == reference_downgrade(versions, version, latest), version
+            else:
+                assert response.data == latest
+        elapsed = timeit.default_timer() - replay_start
+
+        with capsys.disabled():
+            print('\n{} requests: {:.1f} req/s, p50 {:.3f} ms, p99 {:.3f} ms'.format(
+                count,
+                count / elapsed,
+                percentile(latencies, 50) * 1000,
+                percentile(latencies, 99) * 1000,
+            ))
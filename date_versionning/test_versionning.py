@@ -4,12 +4,12 @@ import rest_framework
 from datetime import datetime
 from collections import OrderedDict
 from textwrap import dedent
-from django.db import models
 from rest_framework import serializers
 from rest_framework.decorators import APIView
 from rest_framework.response import Response
-from . import (DateHeaderVersioning, APIChange, RemoveField, RenameField, AddField,
-               VersionnedSerializer)
+from tests.models import Homeworld, Person
+from tests.serializers import PersonSerializer
+from . import DateHeaderVersioning, APIChange, RemoveField, RenameField, AddField
 
 
 class SimpleSerializer(serializers.Serializer):
@@ -128,28 +128,6 @@ instance = {
         }
     }
 
-class HomeworldSerializer(VersionnedSerializer):
-    name = serializers.CharField()
-
-
-class PersonSerializer(VersionnedSerializer):
-    name = serializers.CharField()
-    birthYear = serializers.CharField()
-    eyeColor = serializers.CharField()
-    gender = serializers.CharField()
-    hairColor = serializers.CharField()
-    height = serializers.IntegerField()
-    mass = serializers.IntegerField()
-    homeworld = HomeworldSerializer()
-
-    class Meta:
-        versions = {
-            '2018-08-02': RemoveField('hairStyle', serializers.CharField()),
-            '2018-07-29': RenameField('iColor', 'eyeColor'),
-            '2018-07-27': AddField('gender', serializers.CharField(), default='male')
-        }
-
-
 class VersionView(APIView):
     versioning_class = DateHeaderVersioning
 
@@ -328,21 +306,6 @@ class TestVersionnedSerializer:
         }
 
 
-class Homeworld(models.Model):
-    name = models.CharField(max_length=20)
-
-
-class Person(models.Model):
-    name = models.CharField(max_length=20)
-    birthYear = models.CharField(max_length=4)
-    eyeColor = models.CharField(max_length=10)
-    gender = models.CharField(max_length=6)
-    hairColor = models.CharField(max_length=12)
-    height = models.IntegerField()
-    mass = models.IntegerField()
-    homeworld = models.ForeignKey(Homeworld, on_delete=models.CASCADE)
-
-
 class TestInstance:
     @pytest.mark.django_db
     def test_without_context(self):
@@ -0,0 +1,16 @@
+from django.db import models
+
+
+class Homeworld(models.Model):
+    name = models.CharField(max_length=20)
+
+
+class Person(models.Model):
+    name = models.CharField(max_length=20)
+    birthYear = models.CharField(max_length=4)
+    eyeColor = models.CharField(max_length=10)
+    gender = models.CharField(max_length=6)
+    hairColor = models.CharField(max_length=12)
+    height = models.IntegerField()
+    mass = models.IntegerField()
+    homeworld = models.ForeignKey(Homeworld, on_delete=models.CASCADE)
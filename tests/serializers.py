@@ -0,0 +1,24 @@
+from rest_framework import serializers
+from date_versionning import RemoveField, RenameField, AddField, VersionnedSerializer
+
+
+class HomeworldSerializer(VersionnedSerializer):
+    name = serializers.CharField()
+
+
+class PersonSerializer(VersionnedSerializer):
+    name = serializers.CharField()
+    birthYear = serializers.CharField()
+    eyeColor = serializers.CharField()
+    gender = serializers.CharField()
+    hairColor = serializers.CharField()
+    height = serializers.IntegerField()
+    mass = serializers.IntegerField()
+    homeworld = HomeworldSerializer()
+
+    class Meta:
+        versions = {
+            '2018-08-02': RemoveField('hairStyle', serializers.CharField()),
+            '2018-07-29': RenameField('iColor', 'eyeColor'),
+            '2018-07-27': AddField('gender', serializers.CharField(), default='male')
+        }